@@ -9,6 +9,8 @@ from unittest import mock
 import pandas as pd
 
 import app
+import transaction_categorizer
+from transaction_categorizer import TransactionCategorizer
 
 
 class DummyUpload(io.StringIO):
@@ -333,5 +335,71 @@ class AppTests(unittest.TestCase):
         self.assertEqual(ledger.iloc[0]['source'], 'processing_run')
 
 
+class TransactionCategorizerEquivalenceTests(unittest.TestCase):
+    """Pin the vectorised path and the literal pre-filter to the scalar cascade."""
+
+    FIXTURE = [
+        {'name': 'STRIPE REVERSAL', 'merchant_name': '', 'amount': -100.0, 'personal_finance_category.detailed': 'income_other_income'},
+        {'name': 'Stripe payout', 'merchant_name': 'Stripe', 'amount': -150.0, 'personal_finance_category.detailed': 'income_other_income'},
+        {'name': 'Transfer from savings', 'merchant_name': '', 'amount': -250.0, 'personal_finance_category.detailed': 'transfer_in_account_transfer'},
+        {'name': 'Transfer to deposit account', 'merchant_name': '', 'amount': 300.0, 'personal_finance_category.detailed': 'transfer_out_account_transfer'},
+        {'name': 'transfer_to_pot', 'merchant_name': '', 'amount': 40.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Director loan capital introduced', 'merchant_name': '', 'amount': -250.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Capital injection', 'merchant_name': '', 'amount': -1000.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Monthly account fee', 'merchant_name': '', 'amount': 25.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Overdraft fee', 'merchant_name': '', 'amount': 10.0, 'personal_finance_category.detailed': 'bank_fees_overdraft'},
+        {'name': 'Interest charged', 'merchant_name': '', 'amount': 5.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Unpaid direct debit', 'merchant_name': '', 'amount': 35.0, 'personal_finance_category.detailed': 'bank_fees_insufficient_funds'},
+        {'name': 'Returned payment', 'merchant_name': '', 'amount': 20.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Amazon refund', 'merchant_name': '', 'amount': -30.0, 'personal_finance_category.detailed': 'general_merchandise_books_and_supplies'},
+        {'name': 'HMRC VAT REFUND', 'merchant_name': '', 'amount': -125.0, 'personal_finance_category.detailed': ''},
+        {'name': 'iwoca repayment', 'merchant_name': '', 'amount': 140.0, 'personal_finance_category.detailed': ''},
+        {'name': 'YouLend FND payment', 'merchant_name': '', 'amount': 80.0, 'personal_finance_category.detailed': ''},
+        {'name': 'DISBURSEMENT youlend', 'merchant_name': '', 'amount': -100.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Funding Circle loan advance', 'merchant_name': '', 'amount': -5000.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Loan repayment to Funding Circle', 'merchant_name': '', 'amount': 99.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Card purchase', 'merchant_name': 'Tesco', 'amount': 45.0, 'personal_finance_category.detailed': 'food_and_drink_groceries'},
+        {'name': 'Standing order rent', 'merchant_name': '', 'amount': 700.0, 'personal_finance_category.detailed': 'rent_and_utilities_rent'},
+        {'name': 'Payroll BACS', 'merchant_name': '', 'amount': 1200.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Salary payment', 'merchant_name': '', 'amount': 500.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Faster payments receipt', 'merchant_name': '', 'amount': -200.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Acme Widgets Invoice 123', 'merchant_name': '', 'amount': 50.0, 'personal_finance_category.detailed': 'general_services_other'},
+        {'name': '', 'merchant_name': 'Stripe', 'amount': -60.0, 'personal_finance_category.detailed': ''},
+        {'name': '', 'merchant_name': '', 'amount': 0.0, 'personal_finance_category.detailed': ''},
+        {'name': 'Keyword free credit', 'merchant_name': '', 'amount': -60.0, 'personal_finance_category.detailed': 'income_wages'},
+    ]
+
+    def test_categorize_dataframe_matches_scalar_categorizer(self):
+        categorizer = TransactionCategorizer()
+        vector_categories = categorizer.categorize_dataframe(pd.DataFrame(self.FIXTURE))
+
+        for position, transaction in enumerate(self.FIXTURE):
+            with self.subTest(transaction=transaction['name'] or transaction['merchant_name']):
+                scalar_category, _ = categorizer.categorize_transaction(transaction)
+                self.assertEqual(vector_categories[position], scalar_category)
+
+    def test_fast_gate_never_changes_a_category(self):
+        with mock.patch.object(transaction_categorizer, '_FAST_GATE', None):
+            ungated = [TransactionCategorizer().categorize_transaction(transaction) for transaction in self.FIXTURE]
+
+        gated_categorizer = TransactionCategorizer()
+        for transaction, expected in zip(self.FIXTURE, ungated):
+            with self.subTest(transaction=transaction['name'] or transaction['merchant_name']):
+                self.assertEqual(gated_categorizer.categorize_transaction(transaction), expected)
+
+    def test_regex_gate_fallback_agrees_with_default_gate(self):
+        if transaction_categorizer._FAST_GATE is None:
+            self.skipTest('no literal gate could be built')
+
+        with mock.patch.object(transaction_categorizer, 'hyperscan', None):
+            fallback_gate = transaction_categorizer._build_fast_gate()
+        self.assertIsNotNone(fallback_gate)
+
+        for transaction in self.FIXTURE:
+            text = f"{transaction['name']} {transaction['merchant_name']}".lower()
+            with self.subTest(text=text):
+                self.assertEqual(fallback_gate(text), transaction_categorizer._FAST_GATE(text))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,8 +4,266 @@ Copied from MCAV2's ``app.services.data_processor.TransactionCategorizer`` so
 this app can stay independent while matching MCAV2 transaction categories.
 """
 
+import functools
 import re
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator; the re gate below still applies
+    hyperscan = None
+
+
+def _fuse_patterns(patterns: List[str]) -> Pattern[str]:
+    """Fuse a pattern list into one compiled alternation.
+
+    Scanning one fused regex is a single pass over the text instead of one
+    pass per keyword, which matters on the per-transaction hot path.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+# Raw keyword lists, kept at module level so they are defined once and the
+# fused scanners below are built a single time at import.
+_PAYMENT_PROCESSOR_PATTERNS = [
+    r"stripe", r"sumup", r"zettle", r"square", r"take\s*payments",
+    r"shopify", r"card\s+settlement", r"daily\s+takings", r"payout",
+    r"paypal", r"go\s*cardless", r"klarna", r"worldpay", r"izettle",
+    r"ubereats", r"just\s*eat", r"deliveroo", r"uber", r"bolt",
+    r"fresha", r"treatwell", r"taskrabbit", r"terminal", r"pos\s+deposit",
+    r"revolut", r"capital\s+on\s+tap", r"evo\s*payments?", r"tink",
+    r"teya(?:\s+solutions)?", r"talech", r"barclaycard", r"elavon", r"adyen",
+]
+
+_DIRECT_REVENUE_PATTERNS = [
+    r"sales", r"revenue", r"income", r"payment\s+received",
+    r"customer\s+payment", r"invoice\s+payment", r"service\s+fee",
+]
+
+_LOAN_PATTERNS = [
+    r"iwoca", r"capify", r"fundbox", r"got[\s\-]?capital", r"funding[\s\-]?circle",
+    r"fleximize", r"marketfinance", r"liberis", r"esme[\s\-]?loans", r"thincats",
+    r"white[\s\-]?oak", r"growth[\s\-]?street", r"nucleus[\s\-]?commercial[\s\-]?finance",
+    r"ultimate[\s\-]?finance", r"just[\s\-]?cash[\s\-]?flow", r"boost[\s\-]?capital",
+    r"merchant[\s\-]?money", r"capital[\s\-]?on[\s\-]?tap", r"kriya", r"uncapped",
+    r"lendingcrowd", r"folk2folk", r"funding[\s\-]?tree", r"start[\s\-]?up[\s\-]?loans",
+    r"loan", r"advance", r"financing", r"disbursement",
+    r"you\s?lend", r"\byl\b", r"everyday[\s\-]?people[\s\-]?finance",
+    r"barclays", r"natwest", r"hsbc", r"lloyds", r"santander",
+    r"metro[\s\-]?bank", r"royal[\s\-]?bank[\s\-]?of[\s\-]?scotland", r"\brbs\b",
+    r"starling", r"zempler", r"oak[\s\-]?north", r"allica", r"monzo", r"revolut",
+    r"funding[\s\-]?agent", r"nationwide[\s\-]?finance", r"cubefunder",
+    r"spotcap", r"time[\s\-]?finance", r"together",
+    r"corporate[\s\-]?asset[\s\-]?solutions", r"creative[\s\-]?capital",
+    r"credit4", r"crowd2fund", r"fgi[\s\-]?finance",
+    r"hampshire[\s\-]?trust[\s\-]?bank", r"hodge[\s\-]?bank",
+    r"igf[\s\-]?invoice[\s\-]?finance", r"investec", r"lendinvest",
+    r"maslow[\s\-]?capital", r"mycashline", r"octane[\s\-]?capital",
+    r"secure[\s\-]?trust[\s\-]?bank", r"sme[\s\-]?capital", r"swishfund",
+    r"growth[\s\-]?guarantee[\s\-]?scheme", r"british[\s\-]?business[\s\-]?bank",
+    r"community[\s\-]?development[\s\-]?finance", r"cdfi",
+]
+
+_DEBT_REPAYMENT_PATTERNS = [
+    r"repayment", r"loan\s+payment", r"debt\s+service", r"installment",
+    r"instalment", r"payback", r"repay", r"amortization",
+    r"iwoca", r"capify", r"fundbox", r"got[\s\-]?capital", r"funding[\s\-]?circle",
+    r"fleximize", r"market[\s\-]?finance", r"liberis", r"esme[\s\-]?loans",
+    r"thincats", r"white[\s\-]?oak", r"growth[\s\-]?street",
+    r"nucleus[\s\-]?commercial[\s\-]?finance", r"ultimate[\s\-]?finance",
+    r"just[\s\-]?cash[\s\-]?flow", r"boost[\s\-]?capital", r"merchant[\s\-]?money",
+    r"capital[\s\-]?on[\s\-]?tap", r"kriya", r"uncapped", r"lendingcrowd",
+    r"folk2folk", r"funding[\s\-]?tree", r"start[\s\-]?up[\s\-]?loans",
+    r"you\s?lend", r"\byl\b", r"everyday[\s\-]?people[\s\-]?finance",
+    r"barclays", r"natwest", r"hsbc", r"lloyds", r"santander",
+    r"metro[\s\-]?bank", r"royal[\s\-]?bank[\s\-]?of[\s\-]?scotland", r"\brbs\b",
+    r"starling", r"zempler", r"oak[\s\-]?north", r"allica", r"monzo", r"revolut",
+    r"funding[\s\-]?agent", r"nationwide[\s\-]?finance", r"cubefunder",
+    r"spotcap", r"time[\s\-]?finance", r"together",
+    r"corporate[\s\-]?asset[\s\-]?solutions", r"creative[\s\-]?capital",
+    r"credit4", r"crowd2fund", r"fgi[\s\-]?finance",
+    r"hampshire[\s\-]?trust[\s\-]?bank", r"hodge[\s\-]?bank",
+    r"igf[\s\-]?invoice[\s\-]?finance", r"investec", r"lendinvest",
+    r"maslow[\s\-]?capital", r"mycashline", r"octane[\s\-]?capital",
+    r"secure[\s\-]?trust[\s\-]?bank", r"sme[\s\-]?capital", r"swishfund",
+    r"growth[\s\-]?guarantee[\s\-]?scheme", r"british[\s\-]?business[\s\-]?bank",
+    r"community[\s\-]?development[\s\-]?finance", r"cdfi",
+]
+
+_TRANSFER_PATTERNS = [
+    r"\btransfer\s+(?:from|to)\b", r"\btrf\b", r"\bfaster\s+payment\b",
+    r"\bown\s+account\b", r"\bbetween\s+accounts\b", r"\bmove\s+money\b",
+    r"\baccount\s+transfer\b", r"\bsweep\b", r"\bsavings\s+transfer\b",
+    r"\bcurrent\s+account\s+transfer\b",
+]
+
+_FUNDING_INJECTION_PATTERNS = [
+    r"director[\' ]?s?\s+loan", r"shareholder\s+loan", r"capital\s+introduced",
+    r"capital\s+injection", r"capital\s+contribution", r"owner\s+funds?",
+    r"owner\s+investment", r"founder\s+loan", r"member\s+loan",
+    r"partners?\s+capital", r"shareholder\s+funding",
+]
+
+_BANK_CHARGE_PATTERNS = [
+    r"account\s+fee", r"monthly\s+fee", r"service\s+charge", r"bank\s+charge",
+    r"overdraft\s+fee", r"arranged\s+overdraft", r"unarranged\s+overdraft",
+    r"paid\s+item\s+fee", r"card\s+terminal\s+fee", r"merchant\s+service\s+charge",
+]
+
+_FAILED_PAYMENT_PATTERNS = [
+    r"\bunpaid\b", r"\breturned\b", r"\bbounced\b",
+    r"\binsufficient\s+funds\b", r"\bnsf\b", r"\bdeclined\b",
+    r"\bfailed\b", r"\breversed\b", r"\bchargeback\b",
+]
+
+_EXTENDED_FAILED_PATTERNS = [
+    r"reversal", r"reversed", r"chargeback", r"dispute",
+    r"refund\s+fee", r"rejected", r"cancelled\s+payment", r"payment\s+returned",
+]
+
+_REFUND_PATTERNS = [
+    r"refund", r"rebate", r"credit\s+adj", r"adjustment",
+    r"cashback", r"reimburs", r"money\s+back", r"return\s+credit",
+]
+
+_YOULEND_PATTERN = r"you\s?lend|yl\s?ii|yl\s?ltd|yl\s?limited|yl\s?a\s?limited|\byl\b"
+
+
+def _literal_heads(pattern: str) -> Set[str]:
+    """Extract the literal lead-in of each alternative in ``pattern``.
+
+    Every match of the pattern must contain one of the returned substrings,
+    so they are safe to use as a cheap pre-filter. Returns an empty set when
+    an alternative has no usable literal head (in which case the pattern
+    cannot be gated).
+    """
+    heads = set()
+    for part in pattern.split("|"):
+        while part.startswith(("\\b", "(?:", "(")):
+            if part.startswith("\\b"):
+                part = part[2:]
+            elif part.startswith("(?:"):
+                part = part[3:]
+            else:
+                part = part[1:]
+        head = []
+        for char in part:
+            if char in "\\[]{}()?*+|.^$":
+                if char in "?*" and head:
+                    head.pop()  # the preceding literal is optional
+                break
+            head.append(char)
+        if len(head) < 2:
+            return set()
+        heads.add("".join(head).lower())
+    return heads
+
+
+def _gate_literals() -> Optional[Set[str]]:
+    """Collect the literal tokens that gate every keyword pattern.
+
+    Returns ``None`` (gate disabled) if any pattern cannot be represented
+    by a literal token, since a false negative would change categorisation
+    results.
+    """
+    heads = set()
+    keyword_lists = (
+        _PAYMENT_PROCESSOR_PATTERNS, _DIRECT_REVENUE_PATTERNS,
+        _LOAN_PATTERNS, _DEBT_REPAYMENT_PATTERNS, _TRANSFER_PATTERNS,
+        _FUNDING_INJECTION_PATTERNS, _BANK_CHARGE_PATTERNS,
+        _FAILED_PAYMENT_PATTERNS, _EXTENDED_FAILED_PATTERNS,
+        _REFUND_PATTERNS, [_YOULEND_PATTERN],
+    )
+    for patterns in keyword_lists:
+        for pattern in patterns:
+            pattern_heads = _literal_heads(pattern)
+            if not pattern_heads:
+                return None
+            heads.update(pattern_heads)
+    return heads
+
+
+def _build_fast_gate() -> Optional[Callable[[str], bool]]:
+    """Build the literal pre-filter covering every keyword pattern.
+
+    Most transactions contain none of the tracked keywords; scanning for the
+    literal tokens first is far cheaper than running the fused scanners, so
+    the categoriser can fall straight through to the Plaid-category path on
+    a miss. Uses a Hyperscan multi-literal database when the optional
+    ``hyperscan`` package is installed, otherwise one fused re alternation.
+    """
+    heads = _gate_literals()
+    if heads is None:
+        return None
+
+    if hyperscan is not None:
+        database = hyperscan.Database()
+        expressions = [re.escape(head).encode() for head in sorted(heads)]
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+            * len(expressions),
+        )
+
+        def _on_match(expression_id, start, end, flags, context):
+            return 1  # first hit is enough; stop scanning
+
+        def _hyperscan_gate(text: str) -> bool:
+            try:
+                database.scan(text.encode(errors="ignore"), match_event_handler=_on_match)
+            except hyperscan.ScanTerminated:
+                return True
+            return False
+
+        return _hyperscan_gate
+
+    gate_re = re.compile("|".join(re.escape(head) for head in sorted(heads)), re.IGNORECASE)
+    return lambda text: gate_re.search(text) is not None
+
+
+# Compiled once at import time; categorisation runs per transaction and the
+# repeated ``re.search(pattern, ...)`` form pays a cache lookup on every call.
+_YOULEND_FUNDING_RE = re.compile(r"\b(?:fnd|fund|funding)\b")
+_DISBURSEMENT_RE = re.compile(r"disbursement", re.IGNORECASE)
+
+_FAILED_PLAID_CATEGORIES = [
+    "bank_fees_insufficient_funds",
+    "bank_fees_late_payment",
+    "bank_fees_overdraft",
+    "bank_fees_returned_payment",
+]
+_EXTENDED_FAILED_RE = _fuse_patterns(_EXTENDED_FAILED_PATTERNS)
+_REFUND_RE = _fuse_patterns(_REFUND_PATTERNS)
+_FAST_GATE = _build_fast_gate()
+
+# Exact Plaid detailed-category mappings, shared by the scalar and the
+# vectorised paths so the two tables cannot drift apart.
+_PLAID_EXACT_MAPPING = {
+    "income_wages": ("Income", 0.8),
+    "income_other_income": ("Income", 0.7),
+    "income_dividends": ("Special Inflow", 0.8),
+    "income_interest_earned": ("Special Inflow", 0.8),
+    "transfer_in_cash_advances_and_loans": ("Loans", 0.9),
+    "loan_payments_credit_card_payment": ("Debt Repayments", 0.9),
+    "loan_payments_personal_loan_payment": ("Debt Repayments", 0.9),
+    "loan_payments_other_payment": ("Debt Repayments", 0.8),
+    "bank_fees_insufficient_funds": ("Failed Payment", 0.95),
+    "bank_fees_late_payment": ("Failed Payment", 0.95),
+    "bank_fees_overdraft": ("Failed Payment", 0.95),
+    "bank_fees_returned_payment": ("Failed Payment", 0.95),
+}
+_PLAID_EXACT_CATEGORIES = {key: value[0] for key, value in _PLAID_EXACT_MAPPING.items()}
+
+_EXPENSE_PREFIXES = (
+    "entertainment_", "food_and_drink_", "general_merchandise_",
+    "general_services_", "rent_and_utilities_", "transportation_",
+    "travel_", "home_improvement_", "medical_", "personal_care_",
+    "government_and_non_profit_",
+)
 
 
 class TransactionCategorizer:
@@ -14,101 +272,30 @@ class TransactionCategorizer:
     def __init__(self):
         self.categorization_rules = self._load_categorization_rules()
         self.confidence_threshold = 0.8
+        # Real feeds repeat the same merchant/category text across hundreds
+        # of transactions; a cache hit skips the whole rule cascade. Bound
+        # per instance so caches are not shared between categorisers.
+        self._classify = functools.lru_cache(maxsize=16384)(self._classify_uncached)
 
     def _load_categorization_rules(self) -> Dict[str, Any]:
-        """Load categorisation rules and patterns."""
+        """Load categorisation rules as fused, precompiled scanners."""
         return {
             "income_patterns": {
-                "payment_processors": [
-                    r"stripe", r"sumup", r"zettle", r"square", r"take\s*payments",
-                    r"shopify", r"card\s+settlement", r"daily\s+takings", r"payout",
-                    r"paypal", r"go\s*cardless", r"klarna", r"worldpay", r"izettle",
-                    r"ubereats", r"just\s*eat", r"deliveroo", r"uber", r"bolt",
-                    r"fresha", r"treatwell", r"taskrabbit", r"terminal", r"pos\s+deposit",
-                    r"revolut", r"capital\s+on\s+tap", r"evo\s*payments?", r"tink",
-                    r"teya(\s+solutions)?", r"talech", r"barclaycard", r"elavon", r"adyen",
-                ],
-                "direct_revenue": [
-                    r"sales", r"revenue", r"income", r"payment\s+received",
-                    r"customer\s+payment", r"invoice\s+payment", r"service\s+fee",
-                ],
+                "payment_processors": _fuse_patterns(_PAYMENT_PROCESSOR_PATTERNS),
+                "direct_revenue": _fuse_patterns(_DIRECT_REVENUE_PATTERNS),
                 "special_cases": [
                     (
-                        r"you\s?lend|yl\s?ii|yl\s?ltd|yl\s?limited|yl\s?a\s?limited|\byl\b",
-                        lambda text: "Loans" if re.search(r"\b(fnd|fund|funding)\b", text) else "Income",
+                        re.compile(_YOULEND_PATTERN, re.IGNORECASE),
+                        lambda text: "Loans" if _YOULEND_FUNDING_RE.search(text) else "Income",
                     )
                 ],
             },
-            "loan_patterns": [
-                r"iwoca", r"capify", r"fundbox", r"got[\s\-]?capital", r"funding[\s\-]?circle",
-                r"fleximize", r"marketfinance", r"liberis", r"esme[\s\-]?loans", r"thincats",
-                r"white[\s\-]?oak", r"growth[\s\-]?street", r"nucleus[\s\-]?commercial[\s\-]?finance",
-                r"ultimate[\s\-]?finance", r"just[\s\-]?cash[\s\-]?flow", r"boost[\s\-]?capital",
-                r"merchant[\s\-]?money", r"capital[\s\-]?on[\s\-]?tap", r"kriya", r"uncapped",
-                r"lendingcrowd", r"folk2folk", r"funding[\s\-]?tree", r"start[\s\-]?up[\s\-]?loans",
-                r"loan", r"advance", r"financing", r"disbursement",
-                r"you\s?lend", r"\byl\b", r"everyday[\s\-]?people[\s\-]?finance",
-                r"barclays", r"natwest", r"hsbc", r"lloyds", r"santander",
-                r"metro[\s\-]?bank", r"royal[\s\-]?bank[\s\-]?of[\s\-]?scotland", r"\brbs\b",
-                r"starling", r"zempler", r"oak[\s\-]?north", r"allica", r"monzo", r"revolut",
-                r"funding[\s\-]?agent", r"nationwide[\s\-]?finance", r"cubefunder",
-                r"spotcap", r"time[\s\-]?finance", r"together",
-                r"corporate[\s\-]?asset[\s\-]?solutions", r"creative[\s\-]?capital",
-                r"credit4", r"crowd2fund", r"fgi[\s\-]?finance",
-                r"hampshire[\s\-]?trust[\s\-]?bank", r"hodge[\s\-]?bank",
-                r"igf[\s\-]?invoice[\s\-]?finance", r"investec", r"lendinvest",
-                r"maslow[\s\-]?capital", r"mycashline", r"octane[\s\-]?capital",
-                r"secure[\s\-]?trust[\s\-]?bank", r"sme[\s\-]?capital", r"swishfund",
-                r"growth[\s\-]?guarantee[\s\-]?scheme", r"british[\s\-]?business[\s\-]?bank",
-                r"community[\s\-]?development[\s\-]?finance", r"cdfi",
-            ],
-            "debt_repayment_patterns": [
-                r"repayment", r"loan\s+payment", r"debt\s+service", r"installment",
-                r"instalment", r"payback", r"repay", r"amortization",
-                r"iwoca", r"capify", r"fundbox", r"got[\s\-]?capital", r"funding[\s\-]?circle",
-                r"fleximize", r"market[\s\-]?finance", r"liberis", r"esme[\s\-]?loans",
-                r"thincats", r"white[\s\-]?oak", r"growth[\s\-]?street",
-                r"nucleus[\s\-]?commercial[\s\-]?finance", r"ultimate[\s\-]?finance",
-                r"just[\s\-]?cash[\s\-]?flow", r"boost[\s\-]?capital", r"merchant[\s\-]?money",
-                r"capital[\s\-]?on[\s\-]?tap", r"kriya", r"uncapped", r"lendingcrowd",
-                r"folk2folk", r"funding[\s\-]?tree", r"start[\s\-]?up[\s\-]?loans",
-                r"you\s?lend", r"\byl\b", r"everyday[\s\-]?people[\s\-]?finance",
-                r"barclays", r"natwest", r"hsbc", r"lloyds", r"santander",
-                r"metro[\s\-]?bank", r"royal[\s\-]?bank[\s\-]?of[\s\-]?scotland", r"\brbs\b",
-                r"starling", r"zempler", r"oak[\s\-]?north", r"allica", r"monzo", r"revolut",
-                r"funding[\s\-]?agent", r"nationwide[\s\-]?finance", r"cubefunder",
-                r"spotcap", r"time[\s\-]?finance", r"together",
-                r"corporate[\s\-]?asset[\s\-]?solutions", r"creative[\s\-]?capital",
-                r"credit4", r"crowd2fund", r"fgi[\s\-]?finance",
-                r"hampshire[\s\-]?trust[\s\-]?bank", r"hodge[\s\-]?bank",
-                r"igf[\s\-]?invoice[\s\-]?finance", r"investec", r"lendinvest",
-                r"maslow[\s\-]?capital", r"mycashline", r"octane[\s\-]?capital",
-                r"secure[\s\-]?trust[\s\-]?bank", r"sme[\s\-]?capital", r"swishfund",
-                r"growth[\s\-]?guarantee[\s\-]?scheme", r"british[\s\-]?business[\s\-]?bank",
-                r"community[\s\-]?development[\s\-]?finance", r"cdfi",
-            ],
-            "transfer_patterns": [
-                r"\btransfer\s+(from|to)\b", r"\btrf\b", r"\bfaster\s+payment\b",
-                r"\bown\s+account\b", r"\bbetween\s+accounts\b", r"\bmove\s+money\b",
-                r"\baccount\s+transfer\b", r"\bsweep\b", r"\bsavings\s+transfer\b",
-                r"\bcurrent\s+account\s+transfer\b",
-            ],
-            "funding_injection_patterns": [
-                r"director[\' ]?s?\s+loan", r"shareholder\s+loan", r"capital\s+introduced",
-                r"capital\s+injection", r"capital\s+contribution", r"owner\s+funds?",
-                r"owner\s+investment", r"founder\s+loan", r"member\s+loan",
-                r"partners?\s+capital", r"shareholder\s+funding",
-            ],
-            "bank_charge_patterns": [
-                r"account\s+fee", r"monthly\s+fee", r"service\s+charge", r"bank\s+charge",
-                r"overdraft\s+fee", r"arranged\s+overdraft", r"unarranged\s+overdraft",
-                r"paid\s+item\s+fee", r"card\s+terminal\s+fee", r"merchant\s+service\s+charge",
-            ],
-            "failed_payment_patterns": [
-                r"\bunpaid\b", r"\breturned\b", r"\bbounced\b",
-                r"\binsufficient\s+funds\b", r"\bnsf\b", r"\bdeclined\b",
-                r"\bfailed\b", r"\breversed\b", r"\bchargeback\b",
-            ],
+            "loan_patterns": _fuse_patterns(_LOAN_PATTERNS),
+            "debt_repayment_patterns": _fuse_patterns(_DEBT_REPAYMENT_PATTERNS),
+            "transfer_patterns": _fuse_patterns(_TRANSFER_PATTERNS),
+            "funding_injection_patterns": _fuse_patterns(_FUNDING_INJECTION_PATTERNS),
+            "bank_charge_patterns": _fuse_patterns(_BANK_CHARGE_PATTERNS),
+            "failed_payment_patterns": _fuse_patterns(_FAILED_PAYMENT_PATTERNS),
         }
 
     def categorize_transaction(self, transaction: Dict[str, Any]) -> Tuple[str, float]:
@@ -119,10 +306,25 @@ class TransactionCategorizer:
         category = str(transaction.get("personal_finance_category.detailed", "")).lower()
         amount = transaction.get("amount_original", transaction.get("amount_1", transaction.get("amount", 0)))
 
+        return self._classify(name, transaction_name, merchant_name, category, amount < 0, amount > 0)
+
+    def _classify_uncached(
+        self,
+        name: str,
+        transaction_name: str,
+        merchant_name: str,
+        category: str,
+        is_credit: bool,
+        is_debit: bool,
+    ) -> Tuple[str, float]:
         combined_text = f"{name} {transaction_name} {merchant_name}"
         normalized_text = combined_text.replace("_", " ")
-        is_credit = amount < 0
-        is_debit = amount > 0
+
+        # Cheap literal scan first: when no tracked keyword is present, none
+        # of the text scanners can match, so only the Plaid-category rules
+        # need to run.
+        if _FAST_GATE is not None and not _FAST_GATE(combined_text):
+            return self._categorize_without_keywords(category, is_credit, is_debit)
 
         failed_category, confidence = self._check_failed_payment_patterns(combined_text, category)
         if confidence > self.confidence_threshold:
@@ -152,7 +354,7 @@ class TransactionCategorizer:
             if confidence > self.confidence_threshold:
                 return income_category, confidence
 
-        if re.search(r"disbursement", normalized_text, re.IGNORECASE):
+        if _DISBURSEMENT_RE.search(normalized_text):
             if is_credit or category.startswith("transfer_in_"):
                 return "Loans", 0.9
 
@@ -173,37 +375,186 @@ class TransactionCategorizer:
             return "Uncategorised", 0.3
         return "Expenses", 0.3
 
+    def categorize_dataframe(self, transactions: pd.DataFrame) -> np.ndarray:
+        """Categorise a whole frame of transactions in one vectorised pass.
+
+        Mirrors ``categorize_transaction`` (same rule order, same results)
+        but evaluates every rule as a boolean column mask, so the regex
+        scans and the cascade dispatch run in C instead of once per row.
+        Returns an array of category names aligned with ``transactions``.
+        """
+        index = transactions.index
+
+        def text_column(*names: str) -> pd.Series:
+            for column in names:
+                if column in transactions.columns:
+                    return transactions[column].fillna("").astype(str).str.lower()
+            return pd.Series("", index=index)
+
+        name = text_column("name_y", "name")
+        transaction_name = text_column("transaction_name")
+        merchant_name = text_column("merchant_name")
+        category = text_column("personal_finance_category.detailed")
+
+        amount = pd.Series(0.0, index=index)
+        for column in ("amount_original", "amount_1", "amount"):
+            if column in transactions.columns:
+                amount = pd.to_numeric(transactions[column], errors="coerce").fillna(0.0)
+                break
+
+        combined_text = name + " " + transaction_name + " " + merchant_name
+        normalized_text = combined_text.str.replace("_", " ", regex=False)
+        is_credit = (amount < 0).to_numpy()
+        is_debit = (amount > 0).to_numpy()
+
+        def contains(series: pd.Series, pattern: Pattern[str]) -> np.ndarray:
+            return series.str.contains(pattern, regex=True, na=False).to_numpy()
+
+        def starts(prefix) -> np.ndarray:
+            return category.str.startswith(prefix).to_numpy()
+
+        rules = self.categorization_rules
+        income_rules = rules["income_patterns"]
+        youlend_re = income_rules["special_cases"][0][0]
+
+        failed_plaid = category.isin(_FAILED_PLAID_CATEGORIES).to_numpy()
+        failed = (
+            contains(combined_text, rules["failed_payment_patterns"])
+            | contains(combined_text, _EXTENDED_FAILED_RE)
+            | failed_plaid
+        )
+        refund = contains(combined_text, _REFUND_RE)
+        transfer = contains(combined_text, rules["transfer_patterns"])
+        funding = contains(combined_text, rules["funding_injection_patterns"])
+        bank_charge = contains(combined_text, rules["bank_charge_patterns"]) | (
+            starts("bank_fees_") & ~failed_plaid
+        )
+        income = contains(combined_text, income_rules["payment_processors"]) | contains(
+            combined_text, income_rules["direct_revenue"]
+        )
+        # Vectorised form of the YouLend special case: credit + YouLend text
+        # is a loan when funding keywords are present, otherwise income.
+        youlend = contains(combined_text, youlend_re)
+        youlend_loan = youlend & contains(combined_text, _YOULEND_FUNDING_RE)
+        disbursement = contains(normalized_text, _DISBURSEMENT_RE)
+        loan = contains(combined_text, rules["loan_patterns"])
+        debt = contains(combined_text, rules["debt_repayment_patterns"])
+
+        # Every exact entry of _PLAID_EXACT_MAPPING clears the 0.5
+        # confidence floor, so they all map through.
+        plaid_exact = category.map(_PLAID_EXACT_CATEGORIES)
+        expense_prefix = starts(_EXPENSE_PREFIXES)
+
+        # Conditions in cascade order: np.select takes the first match, which
+        # reproduces the early returns of categorize_transaction.
+        conditions = [
+            failed,
+            is_credit & refund,
+            transfer & is_credit,
+            transfer & is_debit,
+            starts("transfer_in_") & (category != "transfer_in_cash_advances_and_loans").to_numpy(),
+            starts("transfer_out_"),
+            is_credit & funding,
+            is_debit & bank_charge,
+            is_credit & income,
+            is_credit & youlend_loan,
+            is_credit & youlend,
+            disbursement & (is_credit | starts("transfer_in_")),
+            loan & is_credit,
+            loan,
+            is_debit & debt,
+            plaid_exact.notna().to_numpy(),
+            starts("income_"),
+            starts("loan_payments_"),
+            starts("bank_fees_"),
+            starts("transfer_in_"),
+            starts("transfer_out_"),
+            expense_prefix & is_debit,
+            expense_prefix,
+        ]
+        choices = [
+            "Failed Payment",
+            "Special Inflow",
+            "Transfer In",
+            "Transfer Out",
+            "Transfer In",
+            "Transfer Out",
+            "Funding Inflow",
+            "Bank Charge",
+            "Income",
+            "Loans",
+            "Income",
+            "Loans",
+            "Loans",
+            "Debt Repayments",
+            "Debt Repayments",
+            plaid_exact.fillna("").to_numpy(),
+            "Income",
+            "Debt Repayments",
+            "Bank Charge",
+            "Transfer In",
+            "Transfer Out",
+            "Expenses",
+            "Special Inflow",
+        ]
+        default = np.where(is_credit, "Uncategorised", "Expenses")
+        return np.select(conditions, choices, default=default)
+
+    def _categorize_without_keywords(self, category: str, is_credit: bool, is_debit: bool) -> Tuple[str, float]:
+        """Category-only cascade for text with no tracked keywords.
+
+        Mirrors ``categorize_transaction`` with the text scanners skipped;
+        the empty-text calls keep the Plaid-category rules of each check in
+        their original order.
+        """
+        failed_category, confidence = self._check_failed_payment_patterns("", category)
+        if confidence > self.confidence_threshold:
+            return failed_category, confidence
+
+        transfer_category, confidence = self._check_transfer_patterns("", category, is_credit, is_debit)
+        if confidence > self.confidence_threshold:
+            return transfer_category, confidence
+
+        if is_debit:
+            bank_charge_category, confidence = self._check_bank_charge_patterns("", category)
+            if confidence > self.confidence_threshold:
+                return bank_charge_category, confidence
+
+        plaid_category, confidence = self._map_plaid_category(category, is_credit, is_debit)
+        if confidence > 0.5:
+            return plaid_category, confidence
+
+        if is_credit:
+            return "Uncategorised", 0.3
+        return "Expenses", 0.3
+
     def _check_income_patterns(self, text: str) -> Tuple[str, float]:
-        for pattern in self.categorization_rules["income_patterns"]["payment_processors"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Income", 0.95
+        if self.categorization_rules["income_patterns"]["payment_processors"].search(text):
+            return "Income", 0.95
 
-        for pattern in self.categorization_rules["income_patterns"]["direct_revenue"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Income", 0.85
+        if self.categorization_rules["income_patterns"]["direct_revenue"].search(text):
+            return "Income", 0.85
 
         for pattern, condition_func in self.categorization_rules["income_patterns"]["special_cases"]:
-            if re.search(pattern, text, re.IGNORECASE):
+            if pattern.search(text):
                 return condition_func(text), 0.9
 
         return "Unknown", 0.0
 
     def _check_loan_patterns(self, text: str, is_credit: bool) -> Tuple[str, float]:
-        for pattern in self.categorization_rules["loan_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                if is_credit:
-                    return "Loans", 0.9
-                return "Debt Repayments", 0.9
+        if self.categorization_rules["loan_patterns"].search(text):
+            if is_credit:
+                return "Loans", 0.9
+            return "Debt Repayments", 0.9
 
         return "Unknown", 0.0
 
     def _check_transfer_patterns(self, text: str, category: str, is_credit: bool, is_debit: bool) -> Tuple[str, float]:
-        for pattern in self.categorization_rules["transfer_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                if is_credit:
-                    return "Transfer In", 0.9
-                if is_debit:
-                    return "Transfer Out", 0.9
+        if self.categorization_rules["transfer_patterns"].search(text):
+            if is_credit:
+                return "Transfer In", 0.9
+            if is_debit:
+                return "Transfer Out", 0.9
 
         if category.startswith("transfer_in_") and category != "transfer_in_cash_advances_and_loans":
             return "Transfer In", 0.9
@@ -213,16 +564,14 @@ class TransactionCategorizer:
         return "Unknown", 0.0
 
     def _check_funding_patterns(self, text: str) -> Tuple[str, float]:
-        for pattern in self.categorization_rules["funding_injection_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Funding Inflow", 0.9
+        if self.categorization_rules["funding_injection_patterns"].search(text):
+            return "Funding Inflow", 0.9
 
         return "Unknown", 0.0
 
     def _check_bank_charge_patterns(self, text: str, category: str = "") -> Tuple[str, float]:
-        for pattern in self.categorization_rules["bank_charge_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Bank Charge", 0.9
+        if self.categorization_rules["bank_charge_patterns"].search(text):
+            return "Bank Charge", 0.9
 
         if category.startswith("bank_fees_") and category not in {
             "bank_fees_insufficient_funds",
@@ -235,67 +584,33 @@ class TransactionCategorizer:
         return "Unknown", 0.0
 
     def _check_debt_patterns(self, text: str) -> Tuple[str, float]:
-        for pattern in self.categorization_rules["debt_repayment_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Debt Repayments", 0.85
+        if self.categorization_rules["debt_repayment_patterns"].search(text):
+            return "Debt Repayments", 0.85
 
         return "Unknown", 0.0
 
     def _check_failed_payment_patterns(self, text: str, category: str = "") -> Tuple[str, float]:
-        extended_patterns = [
-            r"reversal", r"reversed", r"chargeback", r"dispute",
-            r"refund\s+fee", r"rejected", r"cancelled\s+payment", r"payment\s+returned",
-        ]
-
-        for pattern in self.categorization_rules["failed_payment_patterns"]:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Failed Payment", 0.95
+        if self.categorization_rules["failed_payment_patterns"].search(text):
+            return "Failed Payment", 0.95
 
-        for pattern in extended_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Failed Payment", 0.95
+        if _EXTENDED_FAILED_RE.search(text):
+            return "Failed Payment", 0.95
 
-        failed_plaid_categories = [
-            "bank_fees_insufficient_funds",
-            "bank_fees_late_payment",
-            "bank_fees_overdraft",
-            "bank_fees_returned_payment",
-        ]
-        if category.lower() in failed_plaid_categories:
+        if category.lower() in _FAILED_PLAID_CATEGORIES:
             return "Failed Payment", 0.95
 
         return "Unknown", 0.0
 
     def _check_refund_patterns(self, text: str) -> Tuple[str, float]:
-        refund_patterns = [
-            r"refund", r"rebate", r"credit\s+adj", r"adjustment",
-            r"cashback", r"reimburs", r"money\s+back", r"return\s+credit",
-        ]
-
-        for pattern in refund_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "Special Inflow", 0.9
+        if _REFUND_RE.search(text):
+            return "Special Inflow", 0.9
 
         return "Unknown", 0.0
 
     def _map_plaid_category(self, category: str, is_credit: bool = False, is_debit: bool = True) -> Tuple[str, float]:
-        plaid_mapping = {
-            "income_wages": ("Income", 0.8),
-            "income_other_income": ("Income", 0.7),
-            "income_dividends": ("Special Inflow", 0.8),
-            "income_interest_earned": ("Special Inflow", 0.8),
-            "transfer_in_cash_advances_and_loans": ("Loans", 0.9),
-            "loan_payments_credit_card_payment": ("Debt Repayments", 0.9),
-            "loan_payments_personal_loan_payment": ("Debt Repayments", 0.9),
-            "loan_payments_other_payment": ("Debt Repayments", 0.8),
-            "bank_fees_insufficient_funds": ("Failed Payment", 0.95),
-            "bank_fees_late_payment": ("Failed Payment", 0.95),
-            "bank_fees_overdraft": ("Failed Payment", 0.95),
-            "bank_fees_returned_payment": ("Failed Payment", 0.95),
-        }
-
-        if category in plaid_mapping:
-            return plaid_mapping[category]
+        exact = _PLAID_EXACT_MAPPING.get(category)
+        if exact is not None:
+            return exact
 
         if category.startswith("income_"):
             return "Income", 0.6
@@ -308,14 +623,7 @@ class TransactionCategorizer:
         if category.startswith("transfer_out_"):
             return "Transfer Out", 0.7
 
-        expense_prefixes = [
-            "entertainment_", "food_and_drink_", "general_merchandise_",
-            "general_services_", "rent_and_utilities_", "transportation_",
-            "travel_", "home_improvement_", "medical_", "personal_care_",
-            "government_and_non_profit_",
-        ]
-
-        if any(category.startswith(prefix) for prefix in expense_prefixes):
+        if category.startswith(_EXPENSE_PREFIXES):
             if is_debit:
                 return "Expenses", 0.7
             return "Special Inflow", 0.6